@@ -1,29 +1,150 @@
 import pandas as pd
 import os
 from dotenv import load_dotenv
-import snowflake.connector
+from cachetools import TTLCache
+import atexit
 import base64
+import binascii
+import dataclasses
+import functools
+import hashlib
 import re
-import textwrap
-import requests
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import json
-load_dotenv()
+
+_DOTENV_LOADED = False
+
+# .env is skipped when the launching shell already exports the required
+# settings and one private key source. Optional settings kept only in .env
+# (SNOWFLAKE_PRIVATE_KEY_PWD, SNOWFLAKE_SCHEMA, ...) are then not read, so a
+# deployment relying on the skip must export those too
+_DOTENV_REQUIRED_KEYS = (
+    'SNOWFLAKE_USER', 'SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_WAREHOUSE', 'SNOWFLAKE_DATABASE',
+)
+_DOTENV_KEY_SOURCES = (
+    'PRIVATE_KEY_PEM', 'SNOWFLAKE_PRIVATE_KEY_B64', 'SNOWFLAKE_PRIVATE_KEY',
+    'SNOWFLAKE_PRIVATE_KEY_FILE',
+)
+
+def _load_dotenv_once() -> None:
+    """Load .env into os.environ on the first call; later calls are no-ops."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    if all(os.getenv(k) for k in _DOTENV_REQUIRED_KEYS) and any(os.getenv(k) for k in _DOTENV_KEY_SOURCES):
+        return
+    # Exported variables keep precedence over .env values
+    load_dotenv(override=False)
+
+_load_dotenv_once()
+
+# Process-wide Snowflake connection, reused across queries to avoid paying the
+# key parse + TLS + JWT handshake on every call
+_CONN = None
+_CONN_LOCK = threading.Lock()
+# A pooled connection idle for longer than this (seconds) is pinged with SELECT 1
+# before reuse, since the server may have dropped the session in the meantime
+_CONN_IDLE_PING = 300
+_CONN_LAST_USED = 0.0
+# Fail fast (seconds) when the login handshake hangs instead of blocking callers
+_LOGIN_TIMEOUT = 10
+
+# REST statement polling: overall deadline and backoff bounds (seconds), and
+# the number of result partitions fetched concurrently
+_REST_POLL_TIMEOUT = 600
+_REST_POLL_MIN_DELAY = 0.5
+_REST_POLL_MAX_DELAY = 5.0
+_REST_PARTITION_WORKERS = 8
+
+# Number of queries get_fs_data_many runs concurrently on the shared connection
+_QUERY_WORKERS = 8
+
+# Recent query results keyed by (query text hash, warehouse, as_arrow), so
+# identical queries within the TTL skip the warehouse round trip
+_RESULT_CACHE = TTLCache(maxsize=64, ttl=300)
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# REST API base URL that answered a probe, keyed by account
+_REST_BASE_URLS: dict[str, str] = {}
+
+# Matches the PEM private key header; group 1 is set for encrypted keys
+_PEM_HEADER_RE = re.compile(rb"-----BEGIN (ENCRYPTED )?PRIVATE KEY-----")
+
+# Extracts the BEGIN...END block from raw PEM env values, and collapses the
+# whitespace around each line break within it
+_PEM_EXTRACT_RE = re.compile(r"-----BEGIN [^-]+-----.*?-----END [^-]+-----", re.DOTALL)
+_PEM_LINE_BREAK_RE = re.compile(r"[ \t\r]*\n\s*")
+
+# Heavy third-party modules are imported on first use, so dashboard reruns that
+# never query Snowflake don't pay for them
+@functools.cache
+def _sf():
+    """Return the snowflake.connector module, imported lazily."""
+    import snowflake.connector
+    return snowflake.connector
+
+@functools.cache
+def _serialization():
+    """Return cryptography's serialization module, imported lazily."""
+    from cryptography.hazmat.primitives import serialization
+    return serialization
+
+@functools.cache
+def _requests():
+    """Return the requests module, imported lazily."""
+    import requests
+    return requests
+
+@functools.cache
+def _http_session():
+    """Keep-alive HTTP session for the Snowflake REST API, so TLS is set up once
+    per host rather than once per request."""
+    requests = _requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ))
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    })
+    return session
 
 # Snowflake connection parameters - JWT authentication
+@functools.cache
+def _get_streamlit_secrets():
+    """Return Streamlit secrets if available, captured once per process."""
+    try:
+        import streamlit as st  # local import to avoid hard dependency at import time
+        return st.secrets
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=None)
 def _get_config_value(key: str) -> str | None:
     """Fetch configuration from environment or Streamlit secrets if available."""
     val = os.getenv(key)
     if val is not None and str(val).strip() != '':
         return str(val)
-    try:
-        import streamlit as st  # local import to avoid hard dependency at import time
-        secret_val = st.secrets.get(key)
-        if secret_val is not None and str(secret_val).strip() != '':
-            return str(secret_val)
-    except Exception:
-        pass
+    secrets = _get_streamlit_secrets()
+    if secrets is not None:
+        try:
+            secret_val = secrets.get(key)
+            if secret_val is not None and str(secret_val).strip() != '':
+                return str(secret_val)
+        except Exception:
+            pass
     return None
 
+@functools.cache
 def _resolve_private_key_path() -> str | None:
     """Resolve the private key file path from env or common defaults."""
     base_dir = os.path.dirname(__file__)
@@ -63,32 +184,24 @@ def _load_private_key_bytes_from_env() -> bytes | None:
     private_key_pem = _get_config_value('PRIVATE_KEY_PEM')
     if private_key_pem and private_key_pem.strip():
         text = private_key_pem
-        # Dedent to remove common indentation from .env formatting
-        text = textwrap.dedent(text)
         # Normalize typical \n-escaped content if present
         if "\\n" in text and "\n" not in text:
             text = text.replace("\\n", "\n")
-        # Strip outer whitespace
-        text = text.strip()
-        # Drop bare triple-quote lines that may remain from .env wrapping
-        lines = [ln for ln in text.splitlines() if ln.strip() not in {'"""', "'''"}]
-        # Keep only content between BEGIN and END markers if present
-        begin_idx = next((i for i, ln in enumerate(lines) if '-----BEGIN ' in ln), None)
-        end_idx = next((i for i, ln in enumerate(lines) if '-----END ' in ln), None)
-        if begin_idx is not None and end_idx is not None and end_idx >= begin_idx:
-            lines = lines[begin_idx:end_idx + 1]
-        # Trim whitespace on each line
-        lines = [ln.strip() for ln in lines if ln.strip()]
-        text = "\n".join(lines) + "\n"
+        # Keep only the BEGIN...END block, dropping .env quoting and indentation around it
+        match = _PEM_EXTRACT_RE.search(text)
+        text = match.group(0) if match else text.strip()
+        # Trim whitespace on each line and drop blank lines in a single pass
+        text = _PEM_LINE_BREAK_RE.sub("\n", text) + "\n"
         pem_bytes = text.encode()
 
     # 2) Legacy: explicit base64 if provided
-    private_key_b64 = _get_config_value('SNOWFLAKE_PRIVATE_KEY_B64')
+    private_key_b64 = _sf_config().private_key_b64
     if pem_bytes is None and private_key_b64 and private_key_b64.strip():
         try:
-            pem_bytes = base64.b64decode(private_key_b64.strip())
-        except Exception:
-            raise ValueError("Failed to base64-decode SNOWFLAKE_PRIVATE_KEY_B64")
+            # Clean up the base64 string (remove quotes and whitespace)
+            pem_bytes = base64.b64decode(private_key_b64.strip().strip('"'))
+        except (binascii.Error, ValueError) as e:
+            raise ValueError("Failed to base64-decode SNOWFLAKE_PRIVATE_KEY_B64") from e
 
     # 3) Legacy: raw PEM content
     raw_private_key = _get_config_value('SNOWFLAKE_PRIVATE_KEY')
@@ -102,15 +215,30 @@ def _load_private_key_bytes_from_env() -> bytes | None:
     if pem_bytes is None:
         return None
 
+    return _pem_to_der(pem_bytes, _get_config_value('SNOWFLAKE_PRIVATE_KEY_PWD'))
+
+@functools.lru_cache(maxsize=4)
+def _pem_to_der(pem_bytes: bytes, private_key_pwd: str | None) -> bytes:
+    """Convert PEM private key bytes to DER PKCS8 bytes.
+
+    Cached per (PEM, password), so the ASN.1 parse runs at most once per process
+    for a given key (and once per machine for unencrypted keys, via the on-disk
+    cache), while a changed key in env is still picked up.
+    """
+    pem_digest = hashlib.sha256(pem_bytes).hexdigest()
+    der_pkcs8 = _read_der_cache(pem_digest)
+    if der_pkcs8 is not None:
+        return der_pkcs8
+
     # Convert PEM to DER PKCS8 bytes using cryptography
-    from cryptography.hazmat.primitives import serialization
+    serialization = _serialization()
+    from cryptography.exceptions import UnsupportedAlgorithm
     # Detect encryption requirement from header
-    header_match = re.search(br"-----BEGIN (ENCRYPTED )?PRIVATE KEY-----", pem_bytes)
+    header_match = _PEM_HEADER_RE.search(pem_bytes)
     is_encrypted_header = bool(header_match and header_match.group(1))
-    private_key_pwd = _get_config_value('SNOWFLAKE_PRIVATE_KEY_PWD')
     password_bytes = private_key_pwd.encode() if private_key_pwd else None
     if is_encrypted_header and password_bytes is None:
-        raise ValueError("Encrypted private key detected in PRIVATE_KEY_PEM but SNOWFLAKE_PRIVATE_KEY_PWD is not set.")
+        raise ValueError("Encrypted private key detected but SNOWFLAKE_PRIVATE_KEY_PWD is not set.")
     try:
         private_key = serialization.load_pem_private_key(
             pem_bytes,
@@ -124,160 +252,250 @@ def _load_private_key_bytes_from_env() -> bytes | None:
                 password=None,
             )
         else:
-            raise ValueError(f"Failed to parse private key from env: {e}")
-    except Exception as e:
-        raise ValueError(f"Failed to parse private key from env: {e}")
+            raise ValueError(f"Failed to parse private key from env: {e}") from e
+    except (ValueError, UnsupportedAlgorithm) as e:
+        # Malformed or unsupported key material; anything else is unexpected and propagates as-is
+        raise ValueError(f"Failed to parse private key from env: {e}") from e
 
     der_pkcs8 = private_key.private_bytes(
         encoding=serialization.Encoding.DER,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
     )
+    # Never persist the decrypted form of a password-protected key
+    if not is_encrypted_header:
+        _write_der_cache(pem_digest, der_pkcs8)
     return der_pkcs8
 
+def _der_cache_path(pem_digest: str) -> str:
+    """Location of the on-disk DER cache for a PEM with the given SHA256 digest."""
+    return os.path.join(tempfile.gettempdir(), f"snowkey-{pem_digest}.der")
+
+def _read_der_cache(pem_digest: str) -> bytes | None:
+    """Read cached DER key bytes from disk, or None if not cached."""
+    try:
+        with open(_der_cache_path(pem_digest), 'rb') as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+def _write_der_cache(pem_digest: str, der_bytes: bytes) -> None:
+    """Best-effort atomic write of DER key bytes, readable by the current user only."""
+    path = _der_cache_path(pem_digest)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(der_bytes)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+@dataclasses.dataclass(frozen=True)
+class SFConfig:
+    """Snowflake settings, each read from the matching SNOWFLAKE_* config key."""
+    user: str | None
+    account: str | None
+    warehouse: str | None
+    database: str | None
+    schema: str | None
+    authenticator: str | None
+    private_key_b64: str | None
+    token: str | None
+
+@functools.cache
+def _sf_config() -> SFConfig:
+    """Resolve all Snowflake settings once per process."""
+    return SFConfig(**{
+        field.name: _get_config_value(f"SNOWFLAKE_{field.name.upper()}")
+        for field in dataclasses.fields(SFConfig)
+    })
+
+def clear_result_cache() -> None:
+    """Drop cached query results so the next get_fs_data call hits the warehouse."""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+def _reset_config_cache() -> None:
+    """Clear memoized config, key path, key bytes and query results (e.g. after env changes in tests)."""
+    clear_result_cache()
+    _sf_config.cache_clear()
+    _get_streamlit_secrets.cache_clear()
+    _get_config_value.cache_clear()
+    _resolve_private_key_path.cache_clear()
+    _pem_to_der.cache_clear()
+
+def _resolve_rest_base_url(account: str, possible_urls: list[str]) -> str:
+    """Return the first candidate REST base URL that answers a quick HEAD probe.
+
+    The winning URL is cached per account. If no probe is conclusive, the first
+    candidate is returned uncached and the statement POST decides. The
+    app.snowflake.com web UI answers any path without a 5xx, so it is never
+    probed or cached.
+    """
+    cached = _REST_BASE_URLS.get(account)
+    if cached:
+        return cached
+    # Nothing to choose between, so skip the probe round trip
+    if len(possible_urls) == 1:
+        return possible_urls[0]
+    requests = _requests()
+    for url in possible_urls:
+        if url.startswith('https://app.snowflake.com/'):
+            continue
+        try:
+            # Plain requests.head rather than the shared session: its retry
+            # adapter would stretch the 2s fail-fast probe several times over
+            probe = requests.head(url, timeout=2)
+        except requests.RequestException:
+            continue
+        if probe.status_code < 500:
+            _REST_BASE_URLS[account] = url
+            return url
+    return possible_urls[0]
+
 def _try_rest_api_with_token(sql_query: str) -> pd.DataFrame:
     """Try to execute query using Snowflake REST API with token"""
-    SNOWFLAKE_TOKEN = _get_config_value('SNOWFLAKE_TOKEN')
-    SNOWFLAKE_ACCOUNT = _get_config_value('SNOWFLAKE_ACCOUNT')
-    SNOWFLAKE_WAREHOUSE = _get_config_value('SNOWFLAKE_WAREHOUSE')
-    SNOWFLAKE_DATABASE = _get_config_value('SNOWFLAKE_DATABASE')
-    SNOWFLAKE_SCHEMA = _get_config_value('SNOWFLAKE_SCHEMA')
+    cfg = _sf_config()
     
-    if not all([SNOWFLAKE_TOKEN, SNOWFLAKE_ACCOUNT, SNOWFLAKE_WAREHOUSE, SNOWFLAKE_DATABASE]):
+    if not all([cfg.token, cfg.account, cfg.warehouse, cfg.database]):
         raise ValueError("Missing required parameters for REST API")
     
     # Snowflake REST API endpoint - try different URL formats
     possible_urls = []
     
-    if '.' in SNOWFLAKE_ACCOUNT:
+    if '.' in cfg.account:
         # Format like "zsniary.flipside_pro" 
-        account_parts = SNOWFLAKE_ACCOUNT.split('.')
+        account_parts = cfg.account.split('.')
         possible_urls = [
             f"https://{account_parts[0]}-{account_parts[1]}.snowflakecomputing.com",  # zsniary-flipside_pro
             f"https://{account_parts[0]}.{account_parts[1]}.snowflakecomputing.com",   # zsniary.flipside_pro
             f"https://app.snowflake.com/{account_parts[0]}/{account_parts[1]}",        # app.snowflake.com format
         ]
     else:
-        possible_urls = [f"https://{SNOWFLAKE_ACCOUNT}.snowflakecomputing.com"]
+        possible_urls = [f"https://{cfg.account}.snowflakecomputing.com"]
     
-    base_url = possible_urls[0]  # Start with first option
+    base_url = _resolve_rest_base_url(cfg.account, possible_urls)
     
-    headers = {
-        'Authorization': f'Bearer {SNOWFLAKE_TOKEN}',
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    http = _http_session()
+    http.headers['Authorization'] = f'Bearer {cfg.token}'
     
     # Try to execute query using REST API
     payload = {
         'statement': sql_query,
-        'warehouse': SNOWFLAKE_WAREHOUSE,
-        'database': SNOWFLAKE_DATABASE,
-        'schema': SNOWFLAKE_SCHEMA
+        'warehouse': cfg.warehouse,
+        'database': cfg.database,
+        'schema': cfg.schema,
+        'parameters': {'MULTI_STATEMENT_COUNT': '1'}
     }
     
-    response = requests.post(
-        f"{base_url}/api/v2/statements",
-        headers=headers,
+    statements_url = f"{base_url}/api/v2/statements"
+    # Submit asynchronously: a synchronous POST is held open for ~45s before the
+    # server answers 202, which would outlast the request timeout below
+    response = http.post(
+        statements_url,
+        params={'nullable': 'true', 'async': 'true'},
         json=payload,
         timeout=30
     )
     
-    if response.status_code == 200:
-        result = response.json()
-        # Extract data from REST API response and convert to DataFrame
-        if 'data' in result and result['data']:
-            columns = [col['name'].lower() for col in result['resultSetMetaData']['rowType']]
-            data = result['data']
-            return pd.DataFrame(data, columns=columns)
-        else:
-            return pd.DataFrame()
-    else:
+    # Long-running statements return 202 with a handle; poll until the result is ready
+    if response.status_code == 202:
+        handle = response.json()['statementHandle']
+        statement_url = f"{statements_url}/{handle}"
+        deadline = time.monotonic() + _REST_POLL_TIMEOUT
+        delay = _REST_POLL_MIN_DELAY
+        while response.status_code == 202:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"REST API statement {handle} did not finish within {_REST_POLL_TIMEOUT}s")
+            time.sleep(delay)
+            delay = min(delay * 2, _REST_POLL_MAX_DELAY)
+            response = http.get(statement_url, params={'nullable': 'true'}, timeout=30)
+    
+    if response.status_code != 200:
         raise Exception(f"REST API failed: {response.status_code} - {response.text}")
+    
+    result = response.json()
+    # Extract data from REST API response and convert to DataFrame
+    metadata = result['resultSetMetaData']
+    columns = [col['name'].lower() for col in metadata['rowType']]
+    frames = [pd.DataFrame(result.get('data') or [], columns=columns)]
+    
+    # Partition 0 is inlined in the first response; fetch the remaining ones concurrently
+    partition_count = len(metadata.get('partitionInfo') or [])
+    if partition_count > 1:
+        statement_url = f"{statements_url}/{result['statementHandle']}"
+        
+        def _fetch_partition(partition: int) -> pd.DataFrame:
+            part = http.get(
+                statement_url,
+                params={'partition': partition, 'nullable': 'true'},
+                timeout=30
+            )
+            if part.status_code != 200:
+                raise Exception(f"REST API partition {partition} failed: {part.status_code} - {part.text}")
+            return pd.DataFrame(part.json().get('data') or [], columns=columns)
+        
+        with ThreadPoolExecutor(max_workers=min(_REST_PARTITION_WORKERS, partition_count - 1)) as pool:
+            frames.extend(pool.map(_fetch_partition, range(1, partition_count)))
+    
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+def _resolve_private_key_material() -> tuple[bytes | None, str | None, str | None]:
+    """Pick the private key source once, in priority order.
+
+    Returns (der_bytes, key_file, key_file_pwd): DER bytes when the key comes from
+    env (PRIVATE_KEY_PEM, SNOWFLAKE_PRIVATE_KEY_B64 or SNOWFLAKE_PRIVATE_KEY),
+    otherwise the resolved key file path and its optional password. All three are
+    None when no key is configured.
+    """
+    der_bytes = _load_private_key_bytes_from_env()
+    if der_bytes is not None:
+        return der_bytes, None, None
+    key_path = _resolve_private_key_path()
+    if key_path:
+        return None, key_path, _get_config_value('SNOWFLAKE_PRIVATE_KEY_PWD')
+    return None, None, None
 
-def get_snowflake_connection():
-    """Create and return a Snowflake connection using JWT authentication"""
+def _connect():
+    """Open a new Snowflake connection using JWT authentication"""
     # Get required configuration
-    SNOWFLAKE_USER = _get_config_value('SNOWFLAKE_USER')
-    SNOWFLAKE_ACCOUNT = _get_config_value('SNOWFLAKE_ACCOUNT')
-    SNOWFLAKE_WAREHOUSE = _get_config_value('SNOWFLAKE_WAREHOUSE')
-    SNOWFLAKE_DATABASE = _get_config_value('SNOWFLAKE_DATABASE')
-    SNOWFLAKE_SCHEMA = _get_config_value('SNOWFLAKE_SCHEMA')
-    SNOWFLAKE_AUTHENTICATOR = _get_config_value('SNOWFLAKE_AUTHENTICATOR')
-    SNOWFLAKE_PRIVATE_KEY_B64 = _get_config_value('SNOWFLAKE_PRIVATE_KEY_B64')
+    cfg = _sf_config()
     
     # Validate required vars
     required_vars = {
-        'SNOWFLAKE_USER': SNOWFLAKE_USER,
-        'SNOWFLAKE_ACCOUNT': SNOWFLAKE_ACCOUNT,
-        'SNOWFLAKE_WAREHOUSE': SNOWFLAKE_WAREHOUSE,
-        'SNOWFLAKE_DATABASE': SNOWFLAKE_DATABASE,
+        'SNOWFLAKE_USER': cfg.user,
+        'SNOWFLAKE_ACCOUNT': cfg.account,
+        'SNOWFLAKE_WAREHOUSE': cfg.warehouse,
+        'SNOWFLAKE_DATABASE': cfg.database,
     }
     missing_vars = [var for var, value in required_vars.items() if not value]
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
-    # Handle base64 encoded private key
-    if SNOWFLAKE_PRIVATE_KEY_B64:
-        try:
-            # Clean up the base64 string (remove quotes and whitespace)
-            b64_key = SNOWFLAKE_PRIVATE_KEY_B64.strip().strip('"')
-            
-            # Decode base64 to get PEM content
-            pem_bytes = base64.b64decode(b64_key)
-            
-            # Parse the PEM content to get DER PKCS8 bytes
-            from cryptography.hazmat.primitives import serialization
-            private_key = serialization.load_pem_private_key(pem_bytes, password=None)
-            der_pkcs8 = private_key.private_bytes(
-                encoding=serialization.Encoding.DER,
-                format=serialization.PrivateFormat.PKCS8,
-                encryption_algorithm=serialization.NoEncryption(),
-            )
-            
-            # Use the DER key bytes for connection
-            base_params = {
-                'account': SNOWFLAKE_ACCOUNT,
-                'user': SNOWFLAKE_USER,
-                'authenticator': SNOWFLAKE_AUTHENTICATOR or 'SNOWFLAKE_JWT',
-                'private_key': der_pkcs8,
-                'warehouse': SNOWFLAKE_WAREHOUSE,
-                'database': SNOWFLAKE_DATABASE,
-                'schema': SNOWFLAKE_SCHEMA
-            }
-            
-            return snowflake.connector.connect(**base_params)
-            
-        except Exception as e:
-            print(f"Base64 key authentication failed: {e}")
-            
-    # Try key contents from env variables
-    key_bytes = _load_private_key_bytes_from_env()
-    if key_bytes is not None:
-        base_params = {
-            'account': SNOWFLAKE_ACCOUNT,
-            'user': SNOWFLAKE_USER,
-            'authenticator': SNOWFLAKE_AUTHENTICATOR or 'SNOWFLAKE_JWT',
-            'private_key': key_bytes,
-            'warehouse': SNOWFLAKE_WAREHOUSE,
-            'database': SNOWFLAKE_DATABASE,
-            'schema': SNOWFLAKE_SCHEMA
-        }
-        return snowflake.connector.connect(**base_params)
-
-    # Try key file path
-    key_path = _resolve_private_key_path()
-    if key_path:
-        base_params = {
-            'account': SNOWFLAKE_ACCOUNT,
-            'user': SNOWFLAKE_USER,
-            'authenticator': SNOWFLAKE_AUTHENTICATOR or 'SNOWFLAKE_JWT',
-            'private_key_file': key_path,
-            'warehouse': SNOWFLAKE_WAREHOUSE,
-            'database': SNOWFLAKE_DATABASE,
-            'schema': SNOWFLAKE_SCHEMA
-        }
-        return snowflake.connector.connect(**base_params)
+    der_bytes, key_file, key_file_pwd = _resolve_private_key_material()
+    base_params = {
+        'account': cfg.account,
+        'user': cfg.user,
+        'authenticator': cfg.authenticator or 'SNOWFLAKE_JWT',
+        'warehouse': cfg.warehouse,
+        'database': cfg.database,
+        'schema': cfg.schema,
+        'login_timeout': _LOGIN_TIMEOUT,
+        # Heartbeats keep the pooled session's token valid between queries
+        'client_session_keep_alive': True,
+    }
+    if der_bytes is not None:
+        return _sf().connect(private_key=der_bytes, **base_params)
+    if key_file:
+        if key_file_pwd:
+            base_params['private_key_file_pwd'] = key_file_pwd
+        return _sf().connect(private_key_file=key_file, **base_params)
 
     raise FileNotFoundError(
         "No authentication method available. Provide either:\n"
@@ -286,7 +504,105 @@ def get_snowflake_connection():
         "3. PRIVATE_KEY_PEM (raw PEM content)"
     )
 
-def get_fs_data(query_path, query_text=None, page_number=1, page_size=1):
+def _is_connection_alive(conn) -> bool:
+    """Cheap health check for a connection that has been idle for a while."""
+    try:
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT 1")
+        finally:
+            cur.close()
+        return True
+    except Exception:
+        return False
+
+def get_snowflake_connection(pooled: bool = True):
+    """Return a Snowflake connection using JWT authentication.
+
+    By default this is the process-wide shared connection: it is opened on first
+    use, health-checked after sitting idle, and closed at interpreter exit. Pass
+    pooled=False for a fresh connection that the caller must close.
+    """
+    global _CONN, _CONN_LAST_USED
+    if not pooled:
+        return _connect()
+    with _CONN_LOCK:
+        now = time.monotonic()
+        if _CONN is not None and not _CONN.is_closed():
+            if now - _CONN_LAST_USED < _CONN_IDLE_PING or _is_connection_alive(_CONN):
+                _CONN_LAST_USED = now
+                return _CONN
+            try:
+                _CONN.close()
+            except Exception:
+                pass
+        _CONN = _connect()
+        _CONN_LAST_USED = now
+        return _CONN
+
+def _close_conn():
+    """Close the shared Snowflake connection, if one is open."""
+    global _CONN
+    with _CONN_LOCK:
+        if _CONN is not None:
+            try:
+                _CONN.close()
+            except Exception:
+                pass
+            _CONN = None
+
+atexit.register(_close_conn)
+
+def _drop_conn_if_dead(conn) -> None:
+    """Drop conn from the pool after a failed query if its session no longer answers.
+
+    A session the server has invalidated can still report is_closed() False, and
+    the idle ping never runs while callers keep coming back. A connection that
+    still answers (e.g. the query just had bad SQL) stays pooled, so concurrent
+    queries on it are not cut off.
+    """
+    global _CONN
+    if _is_connection_alive(conn):
+        return
+    with _CONN_LOCK:
+        if _CONN is not conn:
+            return
+        _CONN = None
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+@functools.lru_cache(maxsize=128)
+def _read_query(path: str, mtime_ns: int) -> str:
+    """Read a SQL file; cached per (path, mtime) so edits on disk are picked up."""
+    with open(path, 'r') as f:
+        return f.read()
+
+def _read_query_text(query_path, query_text=None) -> str:
+    """Return query_text if given, otherwise the contents of the SQL file at query_path."""
+    if query_text is not None:
+        return query_text
+    return _read_query(query_path, os.stat(query_path).st_mtime_ns)
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Lowercase column names to match ClickHouse schema.
+
+    Datetime columns keep their native datetime64 dtype; ClickHouse Date/DateTime
+    columns accept them directly, so no per-row string formatting is needed.
+    """
+    df.columns = [col.lower() for col in df.columns]
+    return df
+
+def _fetch_json_frame(cur) -> pd.DataFrame:
+    """Fetch a JSON-format result into a DataFrame.
+
+    Snowflake answers SHOW, DESCRIBE and DDL statements in JSON rather than Arrow,
+    and the connector's Arrow fetch methods reject those results.
+    """
+    return pd.DataFrame(cur.fetchall(), columns=[desc[0] for desc in cur.description])
+
+def get_fs_data(query_path, query_text=None, page_number=1, page_size=1, as_arrow=False):
     """
     Execute a SQL query using Snowflake connection or REST API
     
@@ -295,16 +611,70 @@ def get_fs_data(query_path, query_text=None, page_number=1, page_size=1):
         query_text: Optional direct SQL query text (overrides query_path)
         page_number: Not used with Snowflake (kept for compatibility)
         page_size: Not used with Snowflake (kept for compatibility)
+        as_arrow: Return a pyarrow.Table instead of a DataFrame, skipping pandas conversion
     
     Returns:
-        pandas.DataFrame: Query results
+        pandas.DataFrame | pyarrow.Table: Query results
     """
-    # Get the query text
-    if query_text is None:
-        with open(query_path, 'r') as f:
-            query_text = f.read()
+    query_text = _read_query_text(query_path, query_text)
+    cache_key = (
+        hashlib.blake2b(query_text.encode(), digest_size=16).digest(),
+        _sf_config().warehouse,
+        as_arrow,
+    )
+    with _RESULT_CACHE_LOCK:
+        result = _RESULT_CACHE.get(cache_key)
+    
+    if result is None:
+        if as_arrow:
+            result = _fetch_arrow(query_text)
+        else:
+            frames = list(get_fs_data_iter(None, query_text))
+            result = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[cache_key] = result
+    
+    # Arrow tables are immutable; hand out shallow DataFrame copies so callers can't
+    # add or drop columns on the cached frame
+    return result if as_arrow else result.copy(deep=False)
+
+def _fetch_arrow(query_text: str):
+    """Execute a query and return the result as a pyarrow.Table with lowercase column names."""
+    conn = get_snowflake_connection()
+    cur = conn.cursor()
+    
+    try:
+        cur.execute(query_text)
+        if cur._query_result_format != 'arrow':
+            import pyarrow as pa
+            return pa.Table.from_pandas(_normalize_frame(_fetch_json_frame(cur)), preserve_index=False)
+        table = cur.fetch_arrow_all(force_return_table=True)
+        return table.rename_columns([name.lower() for name in table.column_names])
+    except _sf().DatabaseError:
+        _drop_conn_if_dead(conn)
+        raise
+    finally:
+        # Only the cursor is closed; the connection is kept warm for reuse
+        cur.close()
+
+def get_fs_data_iter(query_path, query_text=None, chunk_rows=100_000):
+    """
+    Execute a SQL query and stream the results as DataFrames of bounded size
+    
+    chunk_rows caps rows per yielded frame; peak memory follows the connector's
+    result-batch size, since each batch is fetched whole before it is sliced.
+    
+    Args:
+        query_path: Path to SQL file containing the query
+        query_text: Optional direct SQL query text (overrides query_path)
+        chunk_rows: Maximum number of rows per yielded DataFrame
+    
+    Yields:
+        pandas.DataFrame: Result chunks, normalized like get_fs_data
+    """
+    query_text = _read_query_text(query_path, query_text)
     
-    # Use Python connector with RSA key authentication
+    # Use the shared Python connector session (RSA key authentication)
     conn = get_snowflake_connection()
     cur = conn.cursor()
     
@@ -312,24 +682,44 @@ def get_fs_data(query_path, query_text=None, page_number=1, page_size=1):
         # Execute the query
         cur.execute(query_text)
         
-        # Fetch column names and convert to lowercase to match ClickHouse schema
-        column_names = [desc[0].lower() for desc in cur.description]
-        
-        # Fetch all data and convert to DataFrame
-        df = pd.DataFrame(cur.fetchall(), columns=column_names)
+        # Decode the Arrow result chunks straight into columnar DataFrames
+        if cur._query_result_format == 'arrow':
+            batches = cur.fetch_pandas_batches()
+        else:
+            batches = [_fetch_json_frame(cur)]
+        yielded = False
+        for batch in batches:
+            batch = _normalize_frame(batch)
+            for start in range(0, len(batch), chunk_rows):
+                yield batch.iloc[start:start + chunk_rows]
+                yielded = True
         
-        # Convert datetime columns for ClickHouse compatibility
-        for col in df.columns:
-            if df[col].dtype.name.startswith('datetime'):
-                if 'date' in col.lower() and 'timestamp' not in col.lower():
-                    # Convert date columns to date format for ClickHouse Date type
-                    df[col] = pd.to_datetime(df[col]).dt.date
-                else:
-                    # Convert timestamp columns to string format for ClickHouse String type
-                    df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-        return df
+        if not yielded:
+            # Keep the result schema for empty results
+            yield pd.DataFrame(columns=[desc[0].lower() for desc in cur.description])
         
+    except _sf().DatabaseError:
+        _drop_conn_if_dead(conn)
+        raise
     finally:
+        # Only the cursor is closed; the connection is kept warm for reuse
         cur.close()
-        conn.close()
+
+def get_fs_data_many(query_paths: list[str]) -> dict[str, pd.DataFrame]:
+    """
+    Execute several SQL files concurrently on the shared Snowflake connection
+    
+    Each query runs on its own cursor in a worker thread, so total wall time is
+    roughly that of the slowest query rather than the sum.
+    
+    Args:
+        query_paths: Paths to SQL files containing the queries
+    
+    Returns:
+        dict: Query results keyed by query path
+    """
+    if not query_paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(_QUERY_WORKERS, len(query_paths))) as pool:
+        frames = pool.map(get_fs_data, query_paths)
+        return dict(zip(query_paths, frames))
@@ -1,15 +1,43 @@
 import os
+import numpy as np
 import pandas as pd
 import streamlit as st
-from flipside_handler import get_fs_data
-import plotly.graph_objects as go
+from flipside_handler import clear_result_cache, get_fs_data
 import plotly.express as px
+import plotly.io as pio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# st.plotly_chart serializes through plotly.io.to_json; use orjson when it is installed
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    pass
+else:
+    pio.json.config.default_engine = "orjson"
 
 SQL_TOP_ASSETS_PATH = os.path.join(os.path.dirname(__file__), "queries_top_assets.sql")
 SQL_DAILY_CUMULATIVE_PATH = os.path.join(os.path.dirname(__file__), "queries_daily_cumulative.sql")
 SQL_SUMMARY_STATS_PATH = os.path.join(os.path.dirname(__file__), "queries_summary_stats.sql")
 
+# Query results are kept in st.session_state and reloaded after this long,
+# matching the run_query_file cache TTL
+DATA_TTL = timedelta(hours=12)
+DATA_SESSION_KEYS = ('summary_df', 'df_daily', 'df_top', 'data_loaded_at')
+
+# Fixed chart width for the wide layout, so charts are not re-laid out on resize
+CHART_WIDTH = 1200
+
+# Hover label for the date-indexed charts; {} is the series name
+_DATE_HOVER_TEMPLATE = '<b>%{{x|%b %d}}</b><br>{}: $%{{y:,.2f}}<extra></extra>'
+
+# Shared chart palette, cycled when a chart has more series than colors
+_COLORS = (
+    '#1D4E89', '#F79256', '#00B2CA', '#7DCFB6', '#FBD1A2', '#B08EA2', '#C5D86D',
+    '#A23E48', '#6C464E', '#9E7682', '#FF6B6B', '#4ECDC4', '#45B7D1',
+)
+
 def _read_sql(path: str) -> str:
     try:
         with open(path, "r") as f:
@@ -17,6 +45,11 @@ def _read_sql(path: str) -> str:
     except Exception:
         return ""
 
+# SQL text shown in the query viewer; read once at import rather than on every rerun
+SUMMARY_SQL = _read_sql(SQL_SUMMARY_STATS_PATH)
+TOP_SQL = _read_sql(SQL_TOP_ASSETS_PATH)
+DAILY_SQL = _read_sql(SQL_DAILY_CUMULATIVE_PATH)
+
 @st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
 def run_query_text(sql_text: str) -> pd.DataFrame:
     return get_fs_data(query_path=None, query_text=sql_text)
@@ -25,6 +58,10 @@ def run_query_text(sql_text: str) -> pd.DataFrame:
 def run_query_file(sql_path: str) -> pd.DataFrame:
     return get_fs_data(query_path=sql_path, query_text=None)
 
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode('utf-8')
+
 def format_currency(value):
     """Format currency values"""
     if pd.isna(value):
@@ -97,173 +134,183 @@ def create_kpi_metrics(summary_df):
             value=value_text
         )
 
-def prepare_daily_data(df: pd.DataFrame, view_type: str = 'asset'):
-    """Prepare data for daily charts based on view type"""
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
+def precompute_daily_aggregates(df: pd.DataFrame, view_type: str = 'asset'):
+    """Aggregate daily fees per date and asset/blockchain once, shared by the daily charts"""
     if df.empty or "date" not in df.columns:
         return None
     
-    if view_type == 'asset':
-        # Group by date and asset
-        pivot_col = 'asset'
-        top_items = df.groupby('asset')['daily_usd_amount'].sum().nlargest(4).index.tolist()
-    else:
-        # Group by date and blockchain - show more blockchains
-        pivot_col = 'source_chain'
-        top_items = df.groupby('source_chain')['daily_usd_amount'].sum().nlargest(8).index.tolist()
-    
-    # Create pivot table
-    df_copy = df.copy()
-    df_copy['category'] = df_copy[pivot_col].apply(lambda x: x if x in top_items else 'Others')
-    
-    pivot_df = df_copy.pivot_table(
-        index='date',
-        columns='category',
-        values='daily_usd_amount',
-        aggfunc='sum',
-        fill_value=0
-    ).reset_index()
+    pivot_col = 'asset' if view_type == 'asset' else 'source_chain'
     
-    return pivot_df
+    # One groupby per view: dates as rows, assets/blockchains as columns.
+    # df_daily is date-sorted at load, so sort_index is only a monotonic check
+    pivot = (
+        df.groupby(['date', pivot_col], sort=False, observed=True)['daily_usd_amount']
+        .sum()
+        .unstack(pivot_col, fill_value=0)
+        .sort_index()
+    )
+    totals = pivot.sum()
+    
+    return {'pivot': pivot, 'totals': totals, 'cumulative': pivot.cumsum()}
 
-def create_daily_stacked_column_chart(df: pd.DataFrame, view_type: str = 'asset'):
-    """Create stacked column chart for daily fee collection"""
-    if df.empty:
+def _top_labels(totals: pd.Series, top_n: int) -> pd.Index:
+    """Labels of the top_n largest totals, in index order.
+    
+    Ties at the cutoff go to the earliest labels, as with nlargest(keep='first');
+    the index is alphabetical, so that breaks ties by label.
+    """
+    values = totals.to_numpy()
+    if top_n >= len(values):
+        return totals.index
+    # Partial selection finds the top_n-th largest value in O(N)
+    cutoff = values[np.argpartition(-values, top_n - 1)[top_n - 1]]
+    above = np.flatnonzero(values > cutoff)
+    ties = np.flatnonzero(values == cutoff)[:top_n - len(above)]
+    return totals.index[np.sort(np.concatenate([above, ties]))]
+
+def _top_items_frame(frame: pd.DataFrame, totals: pd.Series, top_n: int, include_others: bool = True):
+    """Keep the top_n columns by total, optionally folding the rest into 'Others'"""
+    top_items = _top_labels(totals, top_n)
+    result = frame[top_items]
+    if include_others and len(top_items) < len(frame.columns):
+        result = result.assign(Others=frame.drop(columns=top_items).sum(axis=1))
+    # Alphabetical series order (as pivot_table gave), which fixes legend, stacking and colors
+    return result.sort_index(axis=1).reset_index()
+
+def prepare_daily_data(aggregates, view_type: str = 'asset'):
+    """Prepare data for daily charts based on view type"""
+    if aggregates is None:
         return None
     
-    pivot_df = prepare_daily_data(df, view_type)
+    # Show top 4 assets, or more blockchains
+    top_n = 4 if view_type == 'asset' else 8
+    return _top_items_frame(aggregates['pivot'], aggregates['totals'], top_n)
+
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
+def create_daily_stacked_column_chart(aggregates, view_type: str = 'asset'):
+    """Create stacked column chart for daily fee collection"""
+    pivot_df = prepare_daily_data(aggregates, view_type)
     if pivot_df is None:
         return None
     
-    # Define more colors for additional categories
-    colors = ['#1D4E89', '#F79256', '#00B2CA', '#7DCFB6', '#FBD1A2', '#B08EA2', '#C5D86D', '#A23E48', '#6C464E', '#9E7682']
-    
     # Create stacked bar chart
-    fig = go.Figure()
-    
     columns = [col for col in pivot_df.columns if col != 'date']
-    
-    for i, col in enumerate(columns):
-        fig.add_trace(go.Bar(
-            name=col,
-            x=pivot_df['date'],
-            y=pivot_df[col],
-            marker_color=colors[i % len(colors)],
-            hovertemplate='<b>%{x|%b %d}</b><br>' + col + ': $%{y:,.2f}<extra></extra>'
-        ))
+    dates = pivot_df['date'].to_numpy(dtype='datetime64[ns]')
+    
+    data = [
+        {
+            'type': 'bar',
+            'name': col,
+            'x': dates,
+            'y': pivot_df[col].to_numpy(dtype='float64'),
+            'marker': {'color': _COLORS[i % len(_COLORS)]},
+            'hovertemplate': _DATE_HOVER_TEMPLATE.format(col)
+        }
+        for i, col in enumerate(columns)
+    ]
     
     title = f"Daily Fee Collection by {'Asset' if view_type == 'asset' else 'Source Blockchain'} (USD)"
     subtitle = f"Daily fees broken down by top {'assets' if view_type == 'asset' else 'source blockchains'}"
     
-    fig.update_layout(
-        title={
-            'text': f"{title}<br><sub>{subtitle}</sub>",
+    layout = {
+        'title': {
+            'text': title,
+            'subtitle': {'text': subtitle},
             'x': 0.5,
             'xanchor': 'center'
         },
-        barmode='stack',
-        xaxis_title="Date",
-        yaxis_title="Fees (USD)",
-        yaxis=dict(tickformat="$,.0f"),
-        hovermode='x unified',
-        height=500,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
-    )
-    
-    return fig
+        'barmode': 'stack',
+        'xaxis': {'title': {'text': "Date"}},
+        'yaxis': {'title': {'text': "Fees (USD)"}, 'tickformat': "$,.0f"},
+        'hovermode': 'x unified',
+        'width': CHART_WIDTH,
+        'height': 500,
+        'autosize': False,
+        'showlegend': True,
+        'legend': {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+    }
+    
+    return {'data': data, 'layout': layout}
 
-def create_cumulative_area_chart(df: pd.DataFrame, view_type: str = 'asset'):
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
+def create_cumulative_area_chart(aggregates, view_type: str = 'asset'):
     """Create stacked area chart for cumulative fee collection"""
-    if df.empty:
+    if aggregates is None:
         return None
     
-    if view_type == 'asset':
-        pivot_col = 'asset'
-        top_items = df.groupby('asset')['cumulative_usd_amount'].max().nlargest(4).index.tolist()
-    else:
-        pivot_col = 'source_chain'
-        # Increase to 8 blockchains for blockchain view to reduce "Others" category
-        top_items = df.groupby('source_chain')['cumulative_usd_amount'].max().nlargest(8).index.tolist()
-    
-    # Prepare cumulative data
-    df_copy = df.copy()
-    df_copy['category'] = df_copy[pivot_col].apply(lambda x: x if x in top_items else 'Others')
-    
-    # Calculate cumulative for each category
-    cumulative_data = []
-    for date in df_copy['date'].unique():
-        date_data = {'date': date}
-        for category in df_copy['category'].unique():
-            mask = (df_copy['date'] <= date) & (df_copy['category'] == category)
-            date_data[category] = df_copy[mask]['daily_usd_amount'].sum()
-        cumulative_data.append(date_data)
-    
-    cumulative_df = pd.DataFrame(cumulative_data).sort_values('date')
-    
-    # Define more colors for blockchain view
-    colors = ['#1D4E89', '#F79256', '#00B2CA', '#7DCFB6', '#FBD1A2', '#B08EA2', '#C5D86D', '#A23E48', '#6C464E', '#9E7682']
+    # Increase to 8 blockchains for blockchain view to reduce "Others" category
+    top_n = 4 if view_type == 'asset' else 8
+    # Rank by total fees in the view. The SQL cumulative_usd_amount is partitioned
+    # by asset, so its max per source_chain is not the chain's cumulative total
+    cumulative_df = _top_items_frame(aggregates['cumulative'], aggregates['totals'], top_n)
     
     # Create stacked area chart
-    fig = go.Figure()
-    
     columns = [col for col in cumulative_df.columns if col != 'date']
-    
-    for i, col in enumerate(columns):
-        fig.add_trace(go.Scatter(
-            name=col,
-            x=cumulative_df['date'],
-            y=cumulative_df[col],
-            mode='lines',
-            line=dict(width=0.5, color=colors[i % len(colors)]),
-            stackgroup='one',
-            fillcolor=colors[i % len(colors)],
-            hovertemplate='<b>%{x|%b %d}</b><br>' + col + ': $%{y:,.2f}<extra></extra>'
-        ))
+    dates = cumulative_df['date'].to_numpy(dtype='datetime64[ns]')
+    
+    data = [
+        {
+            'type': 'scatter',
+            'name': col,
+            'x': dates,
+            'y': cumulative_df[col].to_numpy(dtype='float64'),
+            'mode': 'lines',
+            'line': {'width': 0.5, 'color': _COLORS[i % len(_COLORS)]},
+            'stackgroup': 'one',
+            'fillcolor': _COLORS[i % len(_COLORS)],
+            'hovertemplate': _DATE_HOVER_TEMPLATE.format(col)
+        }
+        for i, col in enumerate(columns)
+    ]
     
     title = f"Cumulative Fee Collection by {'Asset' if view_type == 'asset' else 'Source Blockchain'} Over Time"
     subtitle = f"Total fees accumulated since inception"
     
-    fig.update_layout(
-        title={
-            'text': f"{title}<br><sub>{subtitle}</sub>",
+    layout = {
+        'title': {
+            'text': title,
+            'subtitle': {'text': subtitle},
             'x': 0.5,
             'xanchor': 'center'
         },
-        xaxis_title="Date",
-        yaxis_title="Cumulative Fees (USD)",
-        yaxis=dict(tickformat="$,.0f"),
-        hovermode='x unified',
-        height=500,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
-    )
-    
-    return fig
+        'xaxis': {'title': {'text': "Date"}},
+        'yaxis': {'title': {'text': "Cumulative Fees (USD)"}, 'tickformat': "$,.0f"},
+        'hovermode': 'x unified',
+        'width': CHART_WIDTH,
+        'height': 500,
+        'autosize': False,
+        'showlegend': True,
+        'legend': {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+    }
+    
+    return {'data': data, 'layout': layout}
 
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
 def create_horizontal_bar_chart(df: pd.DataFrame, view_type: str = 'asset'):
     """Create horizontal bar chart for fee distribution"""
     if df.empty:
         return None
     
     if view_type == 'asset':
-        # Group by asset
-        grouped = df.groupby('asset').agg({
-            'total_usd': 'sum',
-            'total_txs': 'sum'
-        }).reset_index()
         label_col = 'asset'
         # Keep 9 top items for assets
         top_n = 9
     else:
-        # Group by blockchain
-        grouped = df.groupby('source_chain').agg({
-            'total_usd': 'sum',
-            'total_txs': 'sum'
-        }).reset_index()
         label_col = 'source_chain'
         # Show 12 items for blockchains to reduce "Others"
         top_n = 12
     
+    # Group by asset or blockchain
+    grouped = df.groupby(label_col, sort=False, observed=True).agg(
+        total_usd=('total_usd', 'sum'),
+        total_txs=('total_txs', 'sum')
+    ).reset_index()
+    
+    # Remember the full item count and total before trimming to the top items
+    item_count = len(grouped)
+    all_usd = grouped['total_usd'].sum()
+    
     # Sort and take top items
     grouped = grouped.sort_values('total_usd', ascending=False).head(top_n)
     
@@ -272,8 +319,8 @@ def create_horizontal_bar_chart(df: pd.DataFrame, view_type: str = 'asset'):
     grouped['percentage'] = (grouped['total_usd'] / total_sum * 100).round(1)
     
     # Add "Others" if there are more items
-    if len(df[label_col].unique()) > top_n:
-        others_usd = df[~df[label_col].isin(grouped[label_col])]['total_usd'].sum()
+    if item_count > top_n:
+        others_usd = all_usd - total_sum
         others_row = pd.DataFrame({
             label_col: ['Others'],
             'total_usd': [others_usd],
@@ -284,103 +331,131 @@ def create_horizontal_bar_chart(df: pd.DataFrame, view_type: str = 'asset'):
     # Sort for horizontal bar chart
     grouped = grouped.sort_values('total_usd', ascending=True)
     
-    # Define more colors for additional items
-    colors = ['#1D4E89', '#F79256', '#00B2CA', '#7DCFB6', '#FBD1A2', '#B08EA2', '#C5D86D', '#A23E48', '#6C464E', '#9E7682', '#FF6B6B', '#4ECDC4', '#45B7D1']
-    
     # Create bar chart
-    fig = go.Figure(go.Bar(
-        x=grouped['total_usd'],
-        y=grouped[label_col],
-        orientation='h',
-        marker_color=[colors[i % len(colors)] for i in range(len(grouped))],
-        text=grouped.apply(lambda x: f"${x['total_usd']:,.0f} ({x['percentage']}%)", axis=1),
-        textposition='outside',
-        hovertemplate='<b>%{y}</b><br>Total: $%{x:,.2f}<br>Percentage: %{customdata}%<extra></extra>',
-        customdata=grouped['percentage']
-    ))
+    data = [{
+        'type': 'bar',
+        'x': grouped['total_usd'].to_numpy(dtype='float64'),
+        'y': grouped[label_col].to_numpy(),
+        'orientation': 'h',
+        'marker': {'color': [_COLORS[i % len(_COLORS)] for i in range(len(grouped))]},
+        'text': [f"${usd:,.0f} ({pct}%)" for usd, pct in zip(grouped['total_usd'].tolist(), grouped['percentage'].tolist())],
+        'textposition': 'outside',
+        'hovertemplate': '<b>%{y}</b><br>Total: $%{x:,.2f}<br>Percentage: %{customdata}%<extra></extra>',
+        'customdata': grouped['percentage'].to_numpy()
+    }]
     
     title = f"Total Fee Distribution by {'Asset' if view_type == 'asset' else 'Source Blockchain'}"
     subtitle = f"All-time fees collected per {'asset' if view_type == 'asset' else 'source blockchain'}"
     
-    fig.update_layout(
-        title={
-            'text': f"{title}<br><sub>{subtitle}</sub>",
+    layout = {
+        'title': {
+            'text': title,
+            'subtitle': {'text': subtitle},
             'x': 0.5,
             'xanchor': 'center'
         },
-        xaxis_title="Total Fees (USD)",
-        yaxis_title="",
-        xaxis=dict(tickformat="$,.0f"),
-        height=500,
-        showlegend=False
-    )
-    
-    return fig
+        'xaxis': {'title': {'text': "Total Fees (USD)"}, 'tickformat': "$,.0f"},
+        'yaxis': {'title': {'text': ""}},
+        'width': CHART_WIDTH,
+        'height': 500,
+        'autosize': False,
+        'showlegend': False
+    }
+    
+    return {'data': data, 'layout': layout}
 
-def create_top_performers_area_chart(df: pd.DataFrame, view_type: str = 'asset'):
+@st.cache_data(show_spinner=False, ttl=43200)  # 12 hours = 43200 seconds
+def create_top_performers_area_chart(aggregates, view_type: str = 'asset'):
     """Create area chart showing top performers over time"""
-    if df.empty:
+    if aggregates is None:
         return None
     
-    if view_type == 'asset':
-        pivot_col = 'asset'
-        top_items = df.groupby('asset')['daily_usd_amount'].sum().nlargest(5).index.tolist()
-    else:
-        pivot_col = 'source_chain'
-        # Show top 8 blockchains for better visibility
-        top_items = df.groupby('source_chain')['daily_usd_amount'].sum().nlargest(8).index.tolist()
-    
-    # Filter for top items
-    df_filtered = df[df[pivot_col].isin(top_items)].copy()
-    
-    # Pivot data
-    pivot_df = df_filtered.pivot_table(
-        index='date',
-        columns=pivot_col,
-        values='daily_usd_amount',
-        aggfunc='sum',
-        fill_value=0
-    ).reset_index()
-    
-    # Define more colors for additional series
-    colors = ['#1D4E89', '#F79256', '#00B2CA', '#7DCFB6', '#FBD1A2', '#B08EA2', '#C5D86D', '#A23E48']
+    # Show top 8 blockchains for better visibility
+    top_n = 5 if view_type == 'asset' else 8
+    pivot_df = _top_items_frame(aggregates['pivot'], aggregates['totals'], top_n, include_others=False)
     
     # Create area chart
-    fig = go.Figure()
-    
     columns = [col for col in pivot_df.columns if col != 'date']
-    
-    for i, col in enumerate(columns):
-        fig.add_trace(go.Scatter(
-            name=col,
-            x=pivot_df['date'],
-            y=pivot_df[col],
-            mode='lines',
-            line=dict(width=0.5, color=colors[i % len(colors)]),
-            stackgroup='one',
-            fillcolor=colors[i % len(colors)],
-            hovertemplate='<b>%{x|%b %d}</b><br>' + col + ': $%{y:,.2f}<extra></extra>'
-        ))
+    dates = pivot_df['date'].to_numpy(dtype='datetime64[ns]')
+    
+    data = [
+        {
+            'type': 'scatter',
+            'name': col,
+            'x': dates,
+            'y': pivot_df[col].to_numpy(dtype='float64'),
+            'mode': 'lines',
+            'line': {'width': 0.5, 'color': _COLORS[i % len(_COLORS)]},
+            'stackgroup': 'one',
+            'fillcolor': _COLORS[i % len(_COLORS)],
+            'hovertemplate': _DATE_HOVER_TEMPLATE.format(col)
+        }
+        for i, col in enumerate(columns)
+    ]
     
     title = f"Top 5 {'Assets' if view_type == 'asset' else 'Source Blockchains'} Fee Collection Over Time"
     subtitle = f"Daily breakdown of fees by top performing {'assets' if view_type == 'asset' else 'source blockchains'}"
     
-    fig.update_layout(
-        title={
-            'text': f"{title}<br><sub>{subtitle}</sub>",
+    layout = {
+        'title': {
+            'text': title,
+            'subtitle': {'text': subtitle},
             'x': 0.5,
             'xanchor': 'center'
         },
-        xaxis_title="Date",
-        yaxis_title="Daily Fees (USD)",
-        yaxis=dict(tickformat="$,.0f"),
-        hovermode='x unified',
-        height=500,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
-    )
+        'xaxis': {'title': {'text': "Date"}},
+        'yaxis': {'title': {'text': "Daily Fees (USD)"}, 'tickformat': "$,.0f"},
+        'hovermode': 'x unified',
+        'width': CHART_WIDTH,
+        'height': 500,
+        'autosize': False,
+        'showlegend': True,
+        'legend': {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+    }
+    
+    return {'data': data, 'layout': layout}
+
+def _as_categories(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Store repeated label columns as categoricals so groupbys hash int codes"""
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def prepare_daily_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort the daily query result by date once so downstream groupbys can skip sorting"""
+    if df.empty or "date" not in df.columns:
+        return df
+    df = df.sort_values(['date', 'asset', 'source_chain'], kind='mergesort', ignore_index=True)
+    return _as_categories(df, ('asset', 'source_chain'))
+
+def load_dashboard_data():
+    """Load the three query results once per session, reloading after DATA_TTL expires"""
+    loaded_at = st.session_state.get('data_loaded_at')
+    if loaded_at is not None and datetime.now() - loaded_at < DATA_TTL:
+        return st.session_state.summary_df, st.session_state.df_daily, st.session_state.df_top
     
-    return fig
+    with st.spinner("Loading dashboard data..."):
+        try:
+            # The queries are network-bound, so run them side by side
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as pool:
+                f_summary = pool.submit(run_query_file, SQL_SUMMARY_STATS_PATH)
+                f_daily = pool.submit(run_query_file, SQL_DAILY_CUMULATIVE_PATH)
+                f_top = pool.submit(run_query_file, SQL_TOP_ASSETS_PATH)
+                summary_df = f_summary.result()
+                df_daily = prepare_daily_frame(f_daily.result())
+                df_top = _as_categories(f_top.result(), ('asset',))
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+            # Leave session_state untouched so the next rerun retries
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    
+    st.session_state.summary_df = summary_df
+    st.session_state.df_daily = df_daily
+    st.session_state.df_top = df_top
+    st.session_state.data_loaded_at = datetime.now()
+    return summary_df, df_daily, df_top
 
 def main():
     st.set_page_config(
@@ -399,16 +474,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Load data
-    with st.spinner("Loading dashboard data..."):
-        try:
-            summary_df = run_query_file(SQL_SUMMARY_STATS_PATH)
-            df_daily = run_query_file(SQL_DAILY_CUMULATIVE_PATH)
-            df_top = run_query_file(SQL_TOP_ASSETS_PATH)
-        except Exception as e:
-            st.error(f"Error loading data: {e}")
-            summary_df = pd.DataFrame()
-            df_daily = pd.DataFrame()
-            df_top = pd.DataFrame()
+    summary_df, df_daily, df_top = load_dashboard_data()
     
     # Display last available timestamp and refresh info
     if not summary_df.empty:
@@ -432,6 +498,9 @@ def main():
         with col3:
             if st.button("🔄 Refresh Data", help="Clear cache and reload data"):
                 st.cache_data.clear()
+                clear_result_cache()
+                for key in DATA_SESSION_KEYS:
+                    st.session_state.pop(key, None)
                 st.rerun()
     
     # KPI Metrics
@@ -441,6 +510,11 @@ def main():
     # Charts Section
     st.header("📈 Analytics & Trends")
     
+    # Aggregate df_daily once per view; the daily charts all slice these
+    daily_aggregates = {
+        view: precompute_daily_aggregates(df_daily, view) for view in ('asset', 'blockchain')
+    }
+    
     # Daily Fee Collection Chart
     st.subheader("Daily Fee Collection")
     col1, col2 = st.columns([3, 1])
@@ -452,9 +526,9 @@ def main():
             horizontal=True
         )
     view_type = 'asset' if daily_view == "Asset Breakdown" else 'blockchain'
-    fig_daily = create_daily_stacked_column_chart(df_daily, view_type)
+    fig_daily = create_daily_stacked_column_chart(daily_aggregates[view_type], view_type)
     if fig_daily:
-        st.plotly_chart(fig_daily, use_container_width=True)
+        st.plotly_chart(fig_daily, use_container_width=False)
     
     # Cumulative Fee Collection Chart
     st.subheader("Cumulative Fee Collection")
@@ -467,9 +541,9 @@ def main():
             horizontal=True
         )
     view_type = 'asset' if cumulative_view == "Asset Breakdown" else 'blockchain'
-    fig_cumulative = create_cumulative_area_chart(df_daily, view_type)
+    fig_cumulative = create_cumulative_area_chart(daily_aggregates[view_type], view_type)
     if fig_cumulative:
-        st.plotly_chart(fig_cumulative, use_container_width=True)
+        st.plotly_chart(fig_cumulative, use_container_width=False)
     
     # Fee Distribution Chart
     st.subheader("Fee Distribution")
@@ -487,7 +561,7 @@ def main():
     data_source = df_top if view_type == 'asset' else df_daily
     fig_bar = create_horizontal_bar_chart(data_source, view_type)
     if fig_bar:
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(fig_bar, use_container_width=False)
     
     # Top Performers Over Time Chart
     st.subheader("Top Performers Over Time")
@@ -500,9 +574,9 @@ def main():
             horizontal=True
         )
     view_type = 'asset' if performers_view == "Asset Breakdown" else 'blockchain'
-    fig_performers = create_top_performers_area_chart(df_daily, view_type)
+    fig_performers = create_top_performers_area_chart(daily_aggregates[view_type], view_type)
     if fig_performers:
-        st.plotly_chart(fig_performers, use_container_width=True)
+        st.plotly_chart(fig_performers, use_container_width=False)
     
     # Top Assets Table
     st.header("📊 Top 10 Assets by Total Fees Collected")
@@ -546,7 +620,7 @@ def main():
         )
         
         # Download button
-        csv = df_top.to_csv(index=False).encode('utf-8')
+        csv = to_csv_bytes(df_top)
         st.download_button(
             label="📥 Download Full Dataset (CSV)",
             data=csv,
@@ -563,16 +637,13 @@ def main():
         tab1, tab2, tab3 = st.tabs(["Summary Stats", "Top Assets", "Daily/Cumulative"])
         
         with tab1:
-            summary_sql = _read_sql(SQL_SUMMARY_STATS_PATH)
-            st.code(summary_sql, language="sql")
+            st.code(SUMMARY_SQL, language="sql")
         
         with tab2:
-            top_sql = _read_sql(SQL_TOP_ASSETS_PATH)
-            st.code(top_sql, language="sql")
+            st.code(TOP_SQL, language="sql")
         
         with tab3:
-            daily_sql = _read_sql(SQL_DAILY_CUMULATIVE_PATH)
-            st.code(daily_sql, language="sql")
+            st.code(DAILY_SQL, language="sql")
     
     # Footer
     st.divider()
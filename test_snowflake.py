@@ -1,67 +1,130 @@
+import io
 import os
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 
-from dotenv import load_dotenv
+# flipside_handler (and the pandas/dotenv stack behind it) is imported inside
+# main(), so importing this module stays cheap
 
-try:
-    # Reuse the app's logic as much as possible
-    from flipside_handler import (
-        get_snowflake_connection,
-        _load_private_key_bytes_from_env,  # type: ignore
-        _resolve_private_key_path,          # type: ignore
-    )
-except Exception as e:  # pragma: no cover
-    print(f"Failed to import flipside_handler: {e}")
-    sys.exit(1)
 
+# Environment variables reported by this script, read once into a snapshot
+_ENV_KEYS = (
+    "SNOWFLAKE_ACCOUNT",
+    "SNOWFLAKE_USER",
+    "SNOWFLAKE_WAREHOUSE",
+    "SNOWFLAKE_DATABASE",
+    "SNOWFLAKE_SCHEMA",
+    "SNOWFLAKE_PRIVATE_KEY_PWD",
+    "PRIVATE_KEY_PEM",
+    "SNOWFLAKE_PRIVATE_KEY_B64",
+    "SNOWFLAKE_PRIVATE_KEY",
+)
 
-def _detect_key_source() -> str:
+# Env key sources in the order flipside_handler tries them, with descriptions
+_KEY_SOURCES = (
+    ("PRIVATE_KEY_PEM", "raw PEM in env"),
+    ("SNOWFLAKE_PRIVATE_KEY_B64", "base64 PEM in env"),
+    ("SNOWFLAKE_PRIVATE_KEY", "raw PEM in env"),
+)
+
+
+def _env_snapshot() -> Dict[str, str]:
+    """Read the relevant environment variables once; unset ones map to ""."""
+    return {k: os.environ.get(k, "") for k in _ENV_KEYS}
+
+
+def _is_set(env: Dict[str, str], name: str) -> bool:
+    """True if the variable has a non-blank value in the snapshot."""
+    value = env.get(name)
+    return bool(value and value.strip())
+
+
+def _detect_key_source(env: Dict[str, str]) -> str:
     """Describe which key source appears to be configured."""
-    if (os.getenv("PRIVATE_KEY_PEM") or "").strip():
-        return "PRIVATE_KEY_PEM (raw PEM in env)"
-    if (os.getenv("SNOWFLAKE_PRIVATE_KEY_B64") or "").strip():
-        return "SNOWFLAKE_PRIVATE_KEY_B64 (base64 PEM in env)"
-    if (os.getenv("SNOWFLAKE_PRIVATE_KEY") or "").strip():
-        return "SNOWFLAKE_PRIVATE_KEY (raw PEM in env)"
+    for var, label in _KEY_SOURCES:
+        if _is_set(env, var):
+            return f"{var} ({label})"
+    from flipside_handler import _resolve_private_key_path  # type: ignore
     path = _resolve_private_key_path()
     if path:
         return f"key file at: {path}"
     return "no key configured"
 
 
-def _print_env_summary() -> None:
-    print("Snowflake env summary:")
-    print(f"  SNOWFLAKE_ACCOUNT: {os.getenv('SNOWFLAKE_ACCOUNT')}")
-    print(f"  SNOWFLAKE_USER:    {os.getenv('SNOWFLAKE_USER')}")
-    print(f"  WAREHOUSE:         {os.getenv('SNOWFLAKE_WAREHOUSE')}")
-    print(f"  DATABASE:          {os.getenv('SNOWFLAKE_DATABASE')}")
-    print(f"  SCHEMA:            {os.getenv('SNOWFLAKE_SCHEMA')}")
-    pwd_set = bool((os.getenv('SNOWFLAKE_PRIVATE_KEY_PWD') or '').strip())
-    print(f"  Key password set:  {pwd_set}")
-    print(f"  Key source:        {_detect_key_source()}")
-
+def _write_stdout(chunks: List[str]) -> None:
+    """Emit pre-built output with direct write(2) calls, after any pending print() output.
 
-def _validate_env_key() -> Optional[bytes]:
-    """Try parsing the key from env and return the derived DER bytes, or None if not env-based."""
+    Falls back to sys.stdout.write when stdout is not backed by a file
+    descriptor (redirected to a StringIO, captured by pytest, IDE consoles).
+    """
+    text = "".join(chunks)
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        sys.stdout.write(text)
+        return
+    sys.stdout.flush()
+    data = text.encode(sys.stdout.encoding or "utf-8", errors="replace")
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _env_summary_lines(env: Dict[str, str]) -> List[str]:
+    pwd_set = _is_set(env, 'SNOWFLAKE_PRIVATE_KEY_PWD')
+    return [
+        "Snowflake env summary:\n",
+        f"  SNOWFLAKE_ACCOUNT: {env['SNOWFLAKE_ACCOUNT'] or None}\n",
+        f"  SNOWFLAKE_USER:    {env['SNOWFLAKE_USER'] or None}\n",
+        f"  WAREHOUSE:         {env['SNOWFLAKE_WAREHOUSE'] or None}\n",
+        f"  DATABASE:          {env['SNOWFLAKE_DATABASE'] or None}\n",
+        f"  SCHEMA:            {env['SNOWFLAKE_SCHEMA'] or None}\n",
+        f"  Key password set:  {pwd_set}\n",
+        f"  Key source:        {_detect_key_source(env)}\n",
+    ]
+
+
+def _validate_env_key(env: Dict[str, str], out: List[str]) -> Optional[bytes]:
+    """Try parsing the key from env and return the derived DER bytes, or None if not env-based.
+
+    The result of the check is appended to out as report lines.
+    """
+    if not any(_is_set(env, var) for var, _ in _KEY_SOURCES):
+        # Nothing to parse; skip the loader entirely
+        out.append("Key parse check: skipped (using key file path)\n")
+        return None
+    from flipside_handler import _load_private_key_bytes_from_env  # type: ignore
     try:
         key_bytes = _load_private_key_bytes_from_env()
     except Exception as e:
-        print("Key parse check: FAILED")
-        print(f"  {type(e).__name__}: {e}")
+        out.append("Key parse check: FAILED\n")
+        out.append(f"  {type(e).__name__}: {e}\n")
         return None
     if key_bytes is not None:
-        print("Key parse check: OK (env key parsed)")
-        print(f"  DER length: {len(key_bytes)} bytes")
+        out.append("Key parse check: OK (env key parsed)\n")
+        out.append(f"  DER length: {len(key_bytes)} bytes\n")
     else:
-        print("Key parse check: skipped (using key file path)")
+        out.append("Key parse check: skipped (using key file path)\n")
     return key_bytes
 
 
 def main() -> int:
-    load_dotenv()
-    _print_env_summary()
-    _validate_env_key()
+    try:
+        # Reuse the app's logic as much as possible
+        from flipside_handler import (
+            get_snowflake_connection,
+            _load_dotenv_once,  # type: ignore
+        )
+    except Exception as e:  # pragma: no cover
+        print(f"Failed to import flipside_handler: {e}")
+        return 1
+
+    # No-op when flipside_handler already loaded .env on import
+    _load_dotenv_once()
+    env = _env_snapshot()
+    # The env summary and key check are reported together in a single write
+    out = _env_summary_lines(env)
+    _validate_env_key(env, out)
+    _write_stdout(out)
 
     print("\nConnecting to Snowflake...")
     try:
@@ -73,25 +136,32 @@ def main() -> int:
 
     print("Connection: OK")
 
+    from snowflake.connector.cursor import SnowflakeCursor
+
+    # Plain tuple cursor: this one-row query needs no dict or pandas result handling.
+    # Only the cursor is closed here; flipside_handler closes the pooled connection at exit
+    cur = conn.cursor(SnowflakeCursor)
     try:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT CURRENT_VERSION() AS version, CURRENT_USER() AS user, CURRENT_ROLE() AS role, CURRENT_ACCOUNT() AS account, CURRENT_WAREHOUSE() AS warehouse"
-            )
-            row = cur.fetchone()
-            if row:
-                # Order matches select list
-                print("Session info:")
-                print(f"  version:   {row[0]}")
-                print(f"  user:      {row[1]}")
-                print(f"  role:      {row[2]}")
-                print(f"  account:   {row[3]}")
-                print(f"  warehouse: {row[4]}")
+        cur.execute(
+            "SELECT CURRENT_VERSION() AS version, CURRENT_USER() AS user, CURRENT_ROLE() AS role, CURRENT_ACCOUNT() AS account, CURRENT_WAREHOUSE() AS warehouse",
+            num_statements=1,
+            # A one-row metadata query; don't hang on a stalled warehouse
+            timeout=15,
+        )
+        row = cur.fetchone()
+        if row:
+            # Order matches select list
+            version, user, role, account, warehouse = row
+            _write_stdout([
+                "Session info:\n",
+                f"  version:   {version}\n",
+                f"  user:      {user}\n",
+                f"  role:      {role}\n",
+                f"  account:   {account}\n",
+                f"  warehouse: {warehouse}\n",
+            ])
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        cur.close()
 
     return 0
 